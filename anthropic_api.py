@@ -4,7 +4,7 @@ import json
 import uuid
 import logging
 import asyncio
-from typing import Dict, List, Optional, Tuple, Union, Any
+from typing import Dict, List, Mapping, Optional, Tuple, Union, Any
 from flask import current_app
 
 from anthropic_config import AnthropicConfig
@@ -51,14 +51,14 @@ class AnthropicAPI:
         self.werkwijze = self.anthropic_config.werkwijze
         self.project_info = self.anthropic_config.project_info
         
-        logger.debug(f"AnthropicAPI initialized with model: {self.default_model}, temperature: {self.temperature}")
+        logger.debug("AnthropicAPI initialized with model: %s, temperature: %s", self.default_model, self.temperature)
     
-    def get_available_models(self) -> List[Dict[str, Any]]:
+    def get_available_models(self) -> Tuple[Mapping[str, Any], ...]:
         """
-        Get a list of available Claude models.
+        Get the available Claude models.
         
         Returns:
-            List of available models with metadata
+            Shared, read-only sequence of models with metadata
         """
         return self.client.get_available_models()
     
@@ -85,7 +85,8 @@ class AnthropicAPI:
         Returns:
             Dict with current LLM settings
         """
-        return self.client.get_llm_settings(model_id=model_id, preset_name=preset_name)
+        # Model-specific settings are a cached read-only mapping; hand out a copy
+        return dict(self.client.get_llm_settings(model_id=model_id, preset_name=preset_name))
     
     def get_available_presets(self) -> List[Dict[str, Any]]:
         """
@@ -139,12 +140,11 @@ class AnthropicAPI:
             current_settings['max_tokens']
         )
         
-        # Update the config dict for this session
+        # Update the config for this session
+        self.anthropic_config.update_llm_settings(temperature=temperature, max_tokens=max_tokens)
         if temperature is not None:
-            self.anthropic_config.config_dict['ANTHROPIC_TEMPERATURE'] = str(temperature)
             self.temperature = temperature
         if max_tokens is not None:
-            self.anthropic_config.config_dict['ANTHROPIC_MAX_TOKENS'] = str(max_tokens)
             self.max_tokens = max_tokens
         
         logger.info(f"Runtime LLM settings updated: temperature={current_settings['temperature']}, max_tokens={current_settings['max_tokens']}")
@@ -409,7 +409,7 @@ class AnthropicAPI:
         # Apply defaults if still None
         if max_tokens is None:
             max_tokens = self.get_model_max_tokens(model_id)
-            logger.debug(f"Using model-specific max_tokens: {max_tokens} for model: {model_id}")
+            logger.debug("Using model-specific max_tokens: %s for model: %s", max_tokens, model_id)
         
         if temperature is None:
             temperature = self.temperature
@@ -501,7 +501,7 @@ class AnthropicAPI:
             if project_info:
                 logger.debug("Included project_info in the request")
             if preset_name:
-                logger.debug(f"Used LLM preset: {preset_name}")
+                logger.debug("Used LLM preset: %s", preset_name)
             
             return {
                 "conversation_id": conversation_id,
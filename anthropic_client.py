@@ -3,7 +3,7 @@ Anthropic API client module.
 Handles pure API communication with Claude models.
 """
 import logging
-from typing import Dict, List, Optional, Any, Protocol
+from typing import Dict, List, Mapping, Optional, Any, Protocol, Tuple
 import anthropic
 from anthropic_config import AnthropicConfig
 
@@ -123,13 +123,13 @@ class AnthropicClient:
             params["tools"] = tools
             
         logger.debug(
-            f"Sending message to Anthropic API with model: {model}, "
-            f"max_tokens: {final_max_tokens}, temperature: {final_temperature}"
+            "Sending message to Anthropic API with model: %s, max_tokens: %s, temperature: %s",
+            model, final_max_tokens, final_temperature
         )
         if project_info:
             logger.debug("Including project_info in ephemeral cache")
         if preset_name:
-            logger.debug(f"Using LLM preset: {preset_name}")
+            logger.debug("Using LLM preset: %s", preset_name)
         
         try:
             response = self.client.messages.create(**params)
@@ -139,12 +139,12 @@ class AnthropicClient:
             logger.error(f"Error calling Anthropic API: {str(e)}")
             raise
     
-    def get_available_models(self) -> List[Dict[str, Any]]:
+    def get_available_models(self) -> Tuple[Mapping[str, Any], ...]:
         """
-        Get list of available models.
+        Get available models.
         
         Returns:
-            List of model configurations
+            Shared, read-only sequence of model configurations
         """
         return self.config.available_models
     
@@ -160,7 +160,7 @@ class AnthropicClient:
         """
         return self.config.get_model_max_tokens(model_id)
     
-    def get_llm_settings(self, model_id: Optional[str] = None, preset_name: Optional[str] = None) -> Dict[str, Any]:
+    def get_llm_settings(self, model_id: Optional[str] = None, preset_name: Optional[str] = None) -> Mapping[str, Any]:
         """
         Get current LLM settings for a model or preset.
         
@@ -169,7 +169,8 @@ class AnthropicClient:
             preset_name: Optional preset name to load settings from
             
         Returns:
-            Dict with current LLM settings
+            Mapping with current LLM settings; model-specific settings are a
+            shared read-only view, so copy before modifying
         """
         if preset_name:
             return self.config.get_llm_settings(preset_name=preset_name)
@@ -4,42 +4,127 @@ Centralizes all Anthropic API related configuration.
 """
 import os
 import logging
-from typing import Optional, Dict, Any, List
-from functools import cached_property
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Mapping, Tuple
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# Directory containing this module; the prompt files are resolved against it
+_BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+_SYSTEM_PROMPT_PATH = os.path.join(_BASE_PATH, 'system_prompt.txt')
+_WERKWIJZE_PATH = os.path.join(_BASE_PATH, 'werkwijze', 'werkwijze.txt')
+_PROJECT_INFO_PATH = os.path.join(_BASE_PATH, 'project_info.txt')
+
+
+class _cached_property:
+    """
+    Lock-free variant of functools.cached_property.
+    
+    The computed value is stored in the instance ``__dict__`` under the same
+    name, so later reads never reach the descriptor. Unlike the functools
+    version (before Python 3.12) no lock is taken on first access; config
+    values are idempotent, so a racing double computation is harmless.
+    """
+    
+    def __init__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = instance.__dict__[self.name] = self.func(instance)
+        return value
+
+
+@lru_cache(maxsize=None)
+def _load_text_file(path: str) -> Optional[str]:
+    """
+    Read a prompt file once per process and share it between instances.
+    
+    Args:
+        path: Absolute path of the file to read
+        
+    Returns:
+        The file contents, or None if the file does not exist
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            return file.read()
+    except FileNotFoundError:
+        logger.warning(f"{os.path.basename(path)} not found at {path}")
+        return None
+
+# Available models, frozen so every caller can share them without copying.
+# This could be loaded from a config file in the future
+_AVAILABLE_MODELS: Tuple[Mapping[str, Any], ...] = tuple(
+    MappingProxyType(model) for model in (
+        {
+            "id": "claude-opus-4-20250514",
+            "name": "Claude Opus 4",
+            "description": "Most powerful model for complex tasks, best coding model in the world",
+            "context_length": 200000,
+            "max_tokens": 20000,
+        },
+        {
+            "id": "claude-sonnet-4-20250514",
+            "name": "Claude Sonnet 4",
+            "description": "Excellent balance of intelligence and speed for production workloads",
+            "context_length": 200000,
+            "max_tokens": 20000,
+        },
+        {
+            "id": "claude-3-5-haiku-20241022",
+            "name": "Claude 3.5 Haiku",
+            "description": "Fastest model for simpler tasks",
+            "context_length": 200000,
+            "max_tokens": 8192,
+        },
+    )
+)
+_MODELS_BY_ID: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {model["id"]: model for model in _AVAILABLE_MODELS}
+)
+
 
 class AnthropicConfig:
     """Configuration class specifically for Anthropic API settings."""
     
+    # Fixed instance attributes live in slots; ``__dict__`` is kept only as
+    # storage for the lazily loaded ``_cached_property`` values below.
+    __slots__ = ('config_dict', '_api_key', '_resolved_api_key', '_model_settings_cache', '_validated', '__dict__')
+    
      # LLM Settings presets
-    LLM_PRESETS = {
-        "developer_agent": {
+    LLM_PRESETS = MappingProxyType({
+        "developer_agent": MappingProxyType({
             "name": "Python Developer Agent",
             "temperature": 0.2,
             "max_tokens": 20000,
             "description": "Optimized for code generation and development tasks"
-        },
-        "creative_writing": {
+        }),
+        "creative_writing": MappingProxyType({
             "name": "Creative Writing",
             "temperature": 0.8,
             "max_tokens": 10000,
             "description": "Higher creativity for writing and storytelling"
-        },
-        "analysis": {
+        }),
+        "analysis": MappingProxyType({
             "name": "Data Analysis",
             "temperature": 0.1,
             "max_tokens": 10000,
             "description": "Low temperature for analytical and factual tasks"
-        },
-        "balanced": {
+        }),
+        "balanced": MappingProxyType({
             "name": "Balanced",
             "temperature": 0.5,
             "max_tokens": 10000,
             "description": "Balanced settings for general purpose use"
-        }
-    }
+        })
+    })
     
     def __init__(self, api_key: Optional[str] = None, config_dict: Optional[Dict[str, Any]] = None):
         """
@@ -51,25 +136,49 @@ class AnthropicConfig:
         """
         self.config_dict = config_dict or {}
         self._api_key = api_key
-        self._base_path = os.path.dirname(__file__)
+        # Resolve the key once; a missing key is only reported when it is read
+        self._resolved_api_key = api_key or self._get_setting('ANTHROPIC_API_KEY')
+        self._model_settings_cache: Dict[str, Mapping[str, Any]] = {}
+        self._validated = False
+    
+    def _get_setting(self, key: str, default: Any = None) -> Any:
+        """
+        Get a setting from the config dict, falling back to the environment.
+        
+        Only keys that are missing (or explicitly None) in the config dict fall
+        through to the environment, so falsy overrides such as ``0`` or ``""``
+        are honoured instead of being silently replaced.
+        
+        Args:
+            key: Setting name
+            default: Value to use when neither source provides the setting
+            
+        Returns:
+            The resolved setting value
+        """
+        value = self.config_dict.get(key)
+        if value is None:
+            return os.environ.get(key, default)
+        return value
         
     @property
     def api_key(self) -> str:
         """Get the Anthropic API key with validation."""
-        key = self._api_key or self.config_dict.get('ANTHROPIC_API_KEY') or os.environ.get('ANTHROPIC_API_KEY')
+        # Already resolved in __init__; only the presence check runs here
+        key = self._resolved_api_key
         if not key:
             raise ValueError("Anthropic API key is required but not provided")
         return key
     
-    @property
+    @_cached_property
     def default_model(self) -> str:
         """Get the default model."""
-        return self.config_dict.get('ANTHROPIC_DEFAULT_MODEL') or os.environ.get('ANTHROPIC_DEFAULT_MODEL') or 'claude-3-haiku-20240307'
+        return self._get_setting('ANTHROPIC_DEFAULT_MODEL') or 'claude-3-haiku-20240307'
     
-    @property
+    @_cached_property
     def temperature(self) -> float:
         """Get the LLM temperature setting with validation."""
-        temp = self.config_dict.get('ANTHROPIC_TEMPERATURE') or os.environ.get('ANTHROPIC_TEMPERATURE')
+        temp = self._get_setting('ANTHROPIC_TEMPERATURE')
         if temp is not None:
             temp = float(temp)
         else:
@@ -82,10 +191,10 @@ class AnthropicConfig:
         
         return temp
     
-    @property
+    @_cached_property
     def max_tokens(self) -> int:
         """Get the default maximum tokens."""
-        tokens = self.config_dict.get('ANTHROPIC_MAX_TOKENS') or os.environ.get('ANTHROPIC_MAX_TOKENS')
+        tokens = self._get_setting('ANTHROPIC_MAX_TOKENS')
         if tokens is not None:
             tokens = int(tokens)
         else:
@@ -97,10 +206,10 @@ class AnthropicConfig:
         
         return tokens
     
-    @property
+    @_cached_property
     def cache_ttl(self) -> str:
         """Get the cache TTL setting."""
-        return self.config_dict.get('ANTHROPIC_CACHE_TTL') or os.environ.get('ANTHROPIC_CACHE_TTL', '5m')
+        return self._get_setting('ANTHROPIC_CACHE_TTL', '5m')
     
     def get_llm_settings(self, preset_name: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -113,9 +222,10 @@ class AnthropicConfig:
             Dict with LLM settings (temperature, max_tokens, etc.)
         """
         if preset_name and preset_name in self.LLM_PRESETS:
-            preset = self.LLM_PRESETS[preset_name].copy()
-            # Remove metadata fields
-            settings = {k: v for k, v in preset.items() if k not in ['name', 'description']}
+            # Build a fresh dict without the metadata fields; the preset
+            # itself is read-only and shared
+            preset = self.LLM_PRESETS[preset_name]
+            settings = {k: v for k, v in preset.items() if k not in ('name', 'description')}
         else:
             settings = {
                 'temperature': self.temperature,
@@ -156,18 +266,26 @@ class AnthropicConfig:
         
         return True
     
-    def get_model_specific_settings(self, model_id: str) -> Dict[str, Any]:
+    def get_model_specific_settings(self, model_id: str) -> Mapping[str, Any]:
         """
         Get model-specific LLM settings.
         
+        Results for known models are cached until the settings are changed
+        through update_llm_settings().
+        
         Args:
             model_id: The model identifier
             
         Returns:
-            Dict with model-specific settings
+            Read-only mapping with model-specific settings
         """
+        cached = self._model_settings_cache.get(model_id)
+        if cached is not None:
+            return cached
+        
         model_config = self.get_model_config(model_id)
         if not model_config:
+            # Unknown ids are not cached so arbitrary input can't grow the cache
             return self.get_llm_settings()
         
         # Start with general settings
@@ -177,94 +295,71 @@ class AnthropicConfig:
         model_max_tokens = model_config.get('max_tokens', settings['max_tokens'])
         settings['max_tokens'] = min(settings['max_tokens'], model_max_tokens)
         
+        settings = MappingProxyType(settings)
+        self._model_settings_cache[model_id] = settings
         return settings
     
-    @cached_property
+    def update_llm_settings(self, temperature: Optional[float] = None, max_tokens: Optional[int] = None) -> None:
+        """
+        Override LLM settings for this configuration at runtime.
+        
+        Args:
+            temperature: New temperature value
+            max_tokens: New max tokens value
+        """
+        if temperature is not None:
+            self.config_dict['ANTHROPIC_TEMPERATURE'] = str(temperature)
+        if max_tokens is not None:
+            self.config_dict['ANTHROPIC_MAX_TOKENS'] = str(max_tokens)
+        
+        # Drop values derived from the old settings so they are re-read
+        self.__dict__.pop('temperature', None)
+        self.__dict__.pop('max_tokens', None)
+        self._model_settings_cache.clear()
+        self._validated = False
+    
+    @_cached_property
     def system_prompt(self) -> Optional[str]:
         """Lazy load system prompt from file."""
         # Check if already in config dict
         if 'ANTHROPIC_SYSTEM_PROMPT' in self.config_dict:
             return self.config_dict['ANTHROPIC_SYSTEM_PROMPT']
             
-        # Try to load from file
-        system_prompt_path = os.path.join(self._base_path, 'system_prompt.txt')
-        try:
-            with open(system_prompt_path, 'r', encoding='utf-8') as file:
-                return file.read()
-        except FileNotFoundError:
-            logger.warning(f"system_prompt.txt not found at {system_prompt_path}")
-            return None
+        # Load from file (shared between instances)
+        return _load_text_file(_SYSTEM_PROMPT_PATH)
     
-    @cached_property
+    @_cached_property
     def werkwijze(self) -> Optional[str]:
         """Lazy load werkwijze from file."""
         # Check if already in config dict
         if 'ANTHROPIC_WERKWIJZE' in self.config_dict:
             return self.config_dict['ANTHROPIC_WERKWIJZE']
             
-        # Try to load from file
-        werkwijze_path = os.path.join(self._base_path, 'werkwijze', 'werkwijze.txt')
-        try:
-            with open(werkwijze_path, 'r', encoding='utf-8') as file:
-                return file.read()
-        except FileNotFoundError:
-            logger.warning(f"werkwijze.txt not found at {werkwijze_path}")
-            return None
+        # Load from file (shared between instances)
+        return _load_text_file(_WERKWIJZE_PATH)
     
-    @cached_property
+    @_cached_property
     def project_info(self) -> Optional[str]:
         """Lazy load project info from file."""
         # Check if already in config dict
         if 'ANTHROPIC_PROJECT_INFO' in self.config_dict:
             return self.config_dict['ANTHROPIC_PROJECT_INFO']
             
-        # Try to load from file
-        project_info_path = os.path.join(self._base_path, 'project_info.txt')
-        try:
-            with open(project_info_path, 'r', encoding='utf-8') as file:
-                return file.read()
-        except FileNotFoundError:
-            logger.warning(f"project_info.txt not found at {project_info_path}")
-            return None
+        # Load from file (shared between instances)
+        return _load_text_file(_PROJECT_INFO_PATH)
     
     @property
-    def available_models(self) -> List[Dict[str, Any]]:
-        """Get available models configuration."""
-        # This could be loaded from a config file in the future
-        return [
-            {
-                 "id": "claude-opus-4-20250514",
-                "name": "Claude Opus 4",
-                "description": "Most powerful model for complex tasks, best coding model in the world",
-                "context_length": 200000,
-                "max_tokens": 20000,
-            },
-            {
-                "id": "claude-sonnet-4-20250514",
-                "name": "Claude Sonnet 4",
-                "description": "Excellent balance of intelligence and speed for production workloads",
-                "context_length": 200000,
-                "max_tokens": 20000,
-            },
-            {
-                "id": "claude-3-5-haiku-20241022",
-                "name": "Claude 3.5 Haiku",
-                "description": "Fastest model for simpler tasks",
-                "context_length": 200000,
-                "max_tokens": 8192,
-            }
-        ]
+    def available_models(self) -> Tuple[Mapping[str, Any], ...]:
+        """Get available models configuration (shared and read-only)."""
+        return _AVAILABLE_MODELS
     
-    def get_model_config(self, model_id: str) -> Optional[Dict[str, Any]]:
+    def get_model_config(self, model_id: str) -> Optional[Mapping[str, Any]]:
         """Get configuration for a specific model."""
-        for model in self.available_models:
-            if model["id"] == model_id:
-                return model
-        return None
+        return _MODELS_BY_ID.get(model_id)
     
     def get_model_max_tokens(self, model_id: str) -> int:
         """Get max tokens for a specific model."""
-        model_config = self.get_model_config(model_id)
+        model_config = _MODELS_BY_ID.get(model_id)
         if model_config:
             return model_config.get("max_tokens", self.max_tokens)
         logger.warning(f"Model {model_id} not found, using default max_tokens: {self.max_tokens}")
@@ -280,32 +375,39 @@ class AnthropicConfig:
         Raises:
             ValueError: If required configuration is missing
         """
+        if self._validated:
+            return True
+        
         try:
             # This will raise if API key is missing
             _ = self.api_key
-            
-            # Validate LLM settings
-            self.validate_llm_settings(self.temperature, self.max_tokens)
-            
+
+            # The temperature and max_tokens getters already range-check
+            # their values, so reading them is enough to validate
+            _ = self.temperature
+            _ = self.max_tokens
+
+            self._validated = True
             return True
         except ValueError as e:
             logger.error(f"Configuration validation failed: {e}")
             raise
     
-    @property 
+    @_cached_property
     def mcp_servers(self) -> List[str]:
         """Get MCP server configuration."""
-        servers = self.config_dict.get('MCP_SERVERS') or os.getenv("MCP_SERVERS", "")
+        servers = self._get_setting('MCP_SERVERS', '')
         if isinstance(servers, str):
-            return [s.strip() for s in servers.split(",") if s.strip()]
-        return servers or []
+            # Strip each entry once, then drop the empty ones
+            return [s for s in map(str.strip, servers.split(",")) if s]
+        return list(servers)
     
-    @property
+    @_cached_property
     def mcp_server_script(self) -> Optional[str]:
         """Get MCP server script path."""
         return os.environ.get("MCP_SERVER_SCRIPT")
     
-    @property
+    @_cached_property
     def mcp_server_venv_path(self) -> Optional[str]:
         """Get MCP server virtual environment path."""
         return os.environ.get("MCP_SERVER_VENV_PATH")
@@ -1,14 +1,21 @@
 from flask import Flask, render_template, flash, request, jsonify
 import os
 import logging
-from werkzeug.middleware.proxy_fix import ProxyFix
-from flask_wtf.csrf import CSRFProtect
+from functools import lru_cache
 from config import get_config
-from auth import auth_bp, init_oauth, login_required, check_lynxx_domain
-from flask_login import current_user
-from routes.api import api_bp
-from routes.analytics import analytics_bp
-from database import init_db
+
+# Own modules whose log level follows the configured LOG_LEVEL
+_LOGGER_NAMES = (
+    'app',
+    'anthropic_api',
+    'api',  # afhankelijk van hoe je het importeert
+    'routes.api',
+    'routes.analytics',
+    'analytics',
+)
+
+# Shared CSRF extension, created on first use and initialised per app
+csrf = None
 
 def create_app(config_class=None):
     """Create and configure the Flask application
@@ -34,12 +41,19 @@ def create_app(config_class=None):
     os.makedirs(app.instance_path, exist_ok=True)
     
     # Create upload folder if configured
-    if hasattr(app.config, 'UPLOAD_FOLDER'):
+    if 'UPLOAD_FOLDER' in app.config:
         os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
     
     # Initialize security features
     configure_security(app)
     
+    # Blueprints and their dependencies are imported here rather than at
+    # module level so that importing this module stays cheap
+    from database import init_db
+    from auth import auth_bp, init_oauth
+    from routes.api import api_bp
+    from routes.analytics import analytics_bp
+    
     # Initialize database
     init_db(app)
     
@@ -56,22 +70,22 @@ def create_app(config_class=None):
 
     return app
 
+@lru_cache(maxsize=None)
+def _log_formatter(log_format):
+    """Shared logging.Formatter for a format string."""
+    return logging.Formatter(log_format)
+
 def configure_logging(app):
     log_format = app.config.get('LOG_FORMAT', '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     log_level = app.config.get('LOG_LEVEL', logging.INFO)
 
     # Zet basisniveau op WARNING zodat externe libs stil blijven
-    logging.basicConfig(level=log_level, format=log_format)
+    handler = logging.StreamHandler()
+    handler.setFormatter(_log_formatter(log_format))
+    logging.basicConfig(level=log_level, handlers=[handler])
 
     # Stel logniveau expliciet in voor je eigen modules
-    for module in [
-        'app',
-        'anthropic_api',
-        'api',  # afhankelijk van hoe je het importeert
-        'routes.api',
-        'routes.analytics',
-        'analytics'
-    ]:
+    for module in _LOGGER_NAMES:
         logging.getLogger(module).setLevel(log_level)
 
     app.logger.setLevel(log_level)
@@ -79,13 +93,18 @@ def configure_logging(app):
 
 def configure_security(app):
     """Configure security features for the application"""
+    global csrf
+    
     # Initialize CSRF protection if enabled
     if app.config.get('CSRF_ENABLED', True):
-        csrf = CSRFProtect()
+        if csrf is None:
+            from flask_wtf.csrf import CSRFProtect
+            csrf = CSRFProtect()
         csrf.init_app(app)
     
     # Configure proxies if behind a reverse proxy
     if app.config.get('PROXY_COUNT', 0) > 0:
+        from werkzeug.middleware.proxy_fix import ProxyFix
         app.wsgi_app = ProxyFix(
             app.wsgi_app, 
             x_for=app.config.get('PROXY_COUNT'),
@@ -111,9 +130,17 @@ def configure_security(app):
 
 def register_routes(app):
     """Register all application routes"""
+    from flask_login import current_user
+    from auth import login_required, check_lynxx_domain
+    
+    # Config doesn't change after the factory runs; build the titles once
+    app_name = app.config.get('APP_NAME', 'Lynxx Anthropic Console')
+    conversations_title = f"{app_name} - Uw Gesprekken"
+    analytics_title = f"{app_name} - Analytics"
+    
     @app.route('/')
     def home():
-        return render_template('home.html', title=app.config.get('APP_NAME', 'Lynxx Anthropic Console'))
+        return render_template('home.html', title=app_name)
     
     @app.route('/dashboard')
     @login_required
@@ -122,7 +149,7 @@ def register_routes(app):
         """Protected dashboard that requires authentication"""
         return render_template(
             'home.html', 
-            title=f"{app.config.get('APP_NAME', 'Lynxx Anthropic Console')} - Welkom {current_user.name}"
+            title=f"{app_name} - Welkom {current_user.name}"
         )
     
     @app.route('/conversations')
@@ -132,7 +159,7 @@ def register_routes(app):
         """Show user's conversation history"""
         return render_template(
             'conversations.html',
-            title=f"{app.config.get('APP_NAME', 'Lynxx Anthropic Console')} - Uw Gesprekken"
+            title=conversations_title
         )
     
     @app.route('/analytics')
@@ -142,9 +169,12 @@ def register_routes(app):
         """Show analytics dashboard"""
         return render_template(
             'analytics.html',
-            title=f"{app.config.get('APP_NAME', 'Lynxx Anthropic Console')} - Analytics"
+            title=analytics_title
         )
     
+    # Errors raised inside API views are answered with JSON by the blueprint
+    # handlers; unmatched URLs never reach a blueprint, so 404s still need
+    # the path check to keep answering /api/ clients with JSON
     @app.errorhandler(404)
     def page_not_found(e):
         if request.path.startswith('/api/'):
@@ -159,13 +189,6 @@ def register_routes(app):
     @app.errorhandler(500)
     def internal_server_error(e):
         app.logger.error(f"Internal server error: {str(e)}")
-        
-        if request.path.startswith('/api/'):
-            return jsonify({
-                "success": False,
-                "error": "Interne serverfout"
-            }), 500
-            
         flash('Er is een serverfout opgetreden. Probeer het later opnieuw.', 'error')
         return render_template('home.html', title='Serverfout'), 500
 
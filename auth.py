@@ -1,17 +1,30 @@
 import os
-import json
+import time
+import http.cookiejar
 import requests
+from requests.adapters import HTTPAdapter
 from flask import Blueprint, redirect, url_for, session, request, current_app, flash
 from oauthlib.oauth2 import WebApplicationClient
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
 from user import User
-from functools import wraps
+from functools import lru_cache, wraps
 
 # Create Blueprint for auth-related routes
 auth_bp = Blueprint('auth', __name__)
 
-# OAuth 2 client setup
-client = None
+# Read once at import; init_oauth turns it on for debug apps
+_insecure_transport = os.environ.get('OAUTHLIB_INSECURE_TRANSPORT')
+
+# Shared HTTP session so connections to Google's OAuth endpoints are pooled
+_http = requests.Session()
+_http.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+# The session is shared by every login; never keep cookies from one user's calls
+_http.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+
+# Google's discovery document rarely changes; keep it for an hour per URL
+DISCOVERY_CACHE_TTL = 3600
+DISCOVERY_TIMEOUT = 10
+_discovery_cache = {}
 
 # Flask-Login setup
 login_manager = LoginManager()
@@ -25,15 +38,26 @@ def load_user(user_id):
 
 def init_oauth(app):
     """Initialize OAuth client with app configuration."""
-    global client
+    global _insecure_transport
     
     # Allow OAuth over HTTP in development environments
-    if app.config.get('DEBUG', False) and not os.environ.get('OAUTHLIB_INSECURE_TRANSPORT'):
+    if app.config.get('DEBUG', False) and not _insecure_transport:
         os.environ['OAUTHLIB_INSECURE_TRANSPORT'] = '1'
+        _insecure_transport = '1'
         app.logger.warning('OAUTHLIB_INSECURE_TRANSPORT is enabled. OAuth requests will be made over HTTP.')
     
-    client = WebApplicationClient(app.config['GOOGLE_CLIENT_ID'])
+    # Create the OAuth client up front; requests look it up by client ID
+    _get_client(app.config['GOOGLE_CLIENT_ID'])
     login_manager.init_app(app)
+    
+    # Domain checks run on every protected request; make them O(1) lookups
+    app.config['ALLOWED_DOMAINS'] = frozenset(app.config.get('ALLOWED_DOMAINS', ()))
+
+# OAuth 2 client setup
+@lru_cache(maxsize=4)
+def _get_client(client_id):
+    """Get the OAuth 2 client for a Google client ID, creating it once."""
+    return WebApplicationClient(client_id)
 
 def get_google_provider_cfg():
     """Retrieve Google's OAuth 2.0 endpoint configuration."""
@@ -43,7 +67,18 @@ def get_google_provider_cfg():
             "token_endpoint": "https://oauth2.googleapis.com/token",
             "userinfo_endpoint": "https://openidconnect.googleapis.com/v1/userinfo",
         }
-    return requests.get(current_app.config['GOOGLE_DISCOVERY_URL']).json()
+    
+    discovery_url = current_app.config['GOOGLE_DISCOVERY_URL']
+    cached = _discovery_cache.get(discovery_url)
+    if cached and time.monotonic() < cached[0]:
+        return cached[1]
+    
+    # Only cache a successful response; an error stays limited to this request
+    response = _http.get(discovery_url, timeout=DISCOVERY_TIMEOUT)
+    response.raise_for_status()
+    provider_cfg = response.json()
+    _discovery_cache[discovery_url] = (time.monotonic() + DISCOVERY_CACHE_TTL, provider_cfg)
+    return provider_cfg
 
 @auth_bp.route('/login')
 def login():
@@ -56,6 +91,7 @@ def login():
     redirect_uri = url_for('auth.callback', _external=True)
     
     # Build authorization URL
+    client = _get_client(current_app.config['GOOGLE_CLIENT_ID'])
     request_uri = client.prepare_request_uri(
         authorization_endpoint,
         redirect_uri=redirect_uri,
@@ -75,36 +111,38 @@ def callback():
     token_endpoint = google_provider_cfg["token_endpoint"]
     
     # Prepare and send token request
+    client = _get_client(current_app.config['GOOGLE_CLIENT_ID'])
     token_url, headers, body = client.prepare_token_request(
         token_endpoint,
         authorization_response=request.url,
         redirect_url=url_for('auth.callback', _external=True),
         code=code
     )
-    token_response = requests.post(
+    token_response = _http.post(
         token_url,
         headers=headers,
         data=body,
         auth=(current_app.config['GOOGLE_CLIENT_ID'], current_app.config['GOOGLE_CLIENT_SECRET']),
     )
 
-    # Parse the token response
-    client.parse_request_body_response(json.dumps(token_response.json()))
+    # Parse the token response (the raw body is already JSON)
+    client.parse_request_body_response(token_response.text)
     
     # Get user info from Google
     userinfo_endpoint = google_provider_cfg["userinfo_endpoint"]
     uri, headers, body = client.add_token(userinfo_endpoint)
-    userinfo_response = requests.get(uri, headers=headers, data=body)
+    userinfo_response = _http.get(uri, headers=headers, data=body)
+    userinfo = userinfo_response.json()
     
     # Verify user information
-    if userinfo_response.json().get("email_verified"):
-        unique_id = userinfo_response.json()["sub"]
-        user_email = userinfo_response.json()["email"]
-        user_name = userinfo_response.json().get("given_name", "")
-        user_picture = userinfo_response.json().get("picture", "")
+    if userinfo.get("email_verified"):
+        unique_id = userinfo["sub"]
+        user_email = userinfo["email"]
+        user_name = userinfo.get("given_name", "")
+        user_picture = userinfo.get("picture", "")
         
         # Check if user's email domain is allowed
-        email_domain = user_email.split('@')[1]
+        email_domain = user_email.rpartition('@')[2]
         if email_domain not in current_app.config['ALLOWED_DOMAINS']:
             flash('Je hebt geen toegang met dit e-mailadres. Alleen @lynxx.com e-mailadressen zijn toegestaan.', 'error')
             return redirect(url_for('home'))
@@ -141,7 +179,7 @@ def check_lynxx_domain(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
         if current_user.is_authenticated:
-            email_domain = current_user.email.split('@')[1]
+            email_domain = current_user.email.rpartition('@')[2]
             if email_domain not in current_app.config['ALLOWED_DOMAINS']:
                 flash('Je hebt geen toegang met dit e-mailadres. Alleen @lynxx.com e-mailadressen zijn toegestaan.', 'error')
                 logout_user()
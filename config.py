@@ -1,8 +1,11 @@
 import os
 import logging
-from functools import cached_property
+from functools import lru_cache
+from typing import TYPE_CHECKING
 from dotenv import load_dotenv
-from anthropic_config import AnthropicConfig
+
+if TYPE_CHECKING:
+    from anthropic_config import AnthropicConfig
 
 # Setup module logger
 logger = logging.getLogger(__name__)
@@ -10,28 +13,61 @@ logger = logging.getLogger(__name__)
 # Load environment variables from .env file if present
 load_dotenv()
 
+# Plain dict copy of the environment for the settings resolved at import
+_ENV = dict(os.environ)
+
+
+def _env_str(name, default=None):
+    """Read a string setting from the environment; empty values count as unset."""
+    return _ENV.get(name) or default
+
+
+def _env_int(name, default):
+    """Read an integer setting from the environment; empty values count as unset."""
+    value = _ENV.get(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        # Settings are resolved at import; a bad value must not stop the app from starting
+        logger.error(f"Invalid integer for {name}: {value!r}, using default {default}")
+        return default
+
+
+# Settings handed to AnthropicConfig when it is built
+_ANTHROPIC_KEYS = (
+    'ANTHROPIC_DEFAULT_MODEL',
+    'ANTHROPIC_MAX_TOKENS',
+    'ANTHROPIC_CACHE_TTL',
+    'MCP_SERVERS',
+)
+
 class BaseConfig:
     """Base configuration class with common settings for all environments"""
+    # Settings live on the class; instances only hold the lazily built Anthropic config
+    __slots__ = ('_anthropic_config',)
+    
     # Application Name
     APP_NAME = "Lynxx Anthropic Console"
     
     # Flask Configuration
-    SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-key-unsafe-for-production'
+    SECRET_KEY = _env_str('SECRET_KEY', 'dev-key-unsafe-for-production')
     SESSION_COOKIE_HTTPONLY = True
     REMEMBER_COOKIE_HTTPONLY = True
     SESSION_COOKIE_SAMESITE = 'Lax'
     
     # Google OAuth Configuration
-    GOOGLE_CLIENT_ID = os.environ.get('GOOGLE_CLIENT_ID')
-    GOOGLE_CLIENT_SECRET = os.environ.get('GOOGLE_CLIENT_SECRET')
+    GOOGLE_CLIENT_ID = _ENV.get('GOOGLE_CLIENT_ID')
+    GOOGLE_CLIENT_SECRET = _ENV.get('GOOGLE_CLIENT_SECRET')
     GOOGLE_DISCOVERY_URL = 'https://accounts.google.com/.well-known/openid-configuration'
     
     # Database Configuration
-    DATABASE_URI = os.environ.get('DATABASE_URI') or 'sqlite:///app.db'
+    DATABASE_URI = _env_str('DATABASE_URI', 'sqlite:///app.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
     # Lynxx Domain Configuration
-    ALLOWED_DOMAINS = ['lynxx.com']
+    ALLOWED_DOMAINS = frozenset({'lynxx.com'})
     ENABLE_DOMAIN_RESTRICTION = True
     
     # Security Configuration
@@ -49,26 +85,36 @@ class BaseConfig:
     # File Upload Configuration
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16 MB max file size
     UPLOAD_FOLDER = 'uploads'
-    ALLOWED_EXTENSIONS = {'txt', 'pdf', 'csv', 'xlsx', 'docx'}
+    ALLOWED_EXTENSIONS = frozenset({'txt', 'pdf', 'csv', 'xlsx', 'docx'})
+    
+    # Anthropic Configuration
+    # The API key is lowercase so app.config.from_object() doesn't copy the secret
+    _anthropic_api_key = _ENV.get('ANTHROPIC_API_KEY')
+    ANTHROPIC_DEFAULT_MODEL = _env_str('ANTHROPIC_DEFAULT_MODEL', 'claude-3-haiku-20240307')
+    ANTHROPIC_MAX_TOKENS = _env_int('ANTHROPIC_MAX_TOKENS', 4000)
+    ANTHROPIC_CACHE_TTL = _ENV.get('ANTHROPIC_CACHE_TTL', '5m')
+    
+    # Comma separated MCP server list, parsed once with empty entries dropped
+    MCP_SERVERS = tuple(s for s in map(str.strip, _ENV.get('MCP_SERVERS', '').split(',')) if s)
     
-    @cached_property
-    def anthropic_config(self) -> AnthropicConfig:
+    @property
+    def anthropic_config(self) -> 'AnthropicConfig':
         """Lazy-loaded Anthropic configuration."""
-        # Create a config dict from current instance attributes for backwards compatibility
-        config_dict = {
-            'ANTHROPIC_API_KEY': os.environ.get('ANTHROPIC_API_KEY'),
-            'ANTHROPIC_DEFAULT_MODEL': os.environ.get('ANTHROPIC_DEFAULT_MODEL') or 'claude-3-haiku-20240307',
-            'ANTHROPIC_MAX_TOKENS': int(os.environ.get('ANTHROPIC_MAX_TOKENS') or 4000),
-            'ANTHROPIC_CACHE_TTL': os.environ.get('ANTHROPIC_CACHE_TTL', '5m'),
-            'MCP_SERVERS': os.getenv("MCP_SERVERS", ""),
-        }
-        return AnthropicConfig(config_dict=config_dict)
+        try:
+            return self._anthropic_config
+        except AttributeError:
+            from anthropic_config import AnthropicConfig
+            # AnthropicConfig may update its dict at runtime, so give it its own copy
+            config_dict = {key: getattr(self, key) for key in _ANTHROPIC_KEYS}
+            config_dict['ANTHROPIC_API_KEY'] = self._anthropic_api_key
+            self._anthropic_config = AnthropicConfig(config_dict=config_dict)
+            return self._anthropic_config
     
     def get_anthropic_config_dict(self) -> dict:
         """Get Anthropic configuration as a dictionary for backwards compatibility."""
         config = self.anthropic_config
         return {
-            'ANTHROPIC_API_KEY': config.api_key if hasattr(config, '_api_key') and config._api_key else os.environ.get('ANTHROPIC_API_KEY'),
+            'ANTHROPIC_API_KEY': self._anthropic_api_key,
             'ANTHROPIC_DEFAULT_MODEL': config.default_model,
             'ANTHROPIC_MAX_TOKENS': config.max_tokens,
             'ANTHROPIC_CACHE_TTL': config.cache_ttl,
@@ -77,14 +123,6 @@ class BaseConfig:
             'MCP_SERVERS': config.mcp_servers,
         }
     
-    def __getattr__(self, name):
-        """Provide backwards compatibility for Anthropic config attributes."""
-        if name.startswith('ANTHROPIC_') or name == 'MCP_SERVERS':
-            config_dict = self.get_anthropic_config_dict()
-            if name in config_dict:
-                return config_dict[name]
-        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
-    
     def validate(self) -> bool:
         """
         Validate the configuration.
@@ -111,6 +149,7 @@ class BaseConfig:
 
 class DevelopmentConfig(BaseConfig):
     """Development configuration with debug features enabled"""
+    __slots__ = ()
     DEBUG = True
     TESTING = False
     LOG_LEVEL = logging.INFO
@@ -124,6 +163,7 @@ class DevelopmentConfig(BaseConfig):
 
 class TestingConfig(BaseConfig):
     """Testing configuration optimized for automated tests"""
+    __slots__ = ()
     DEBUG = False
     TESTING = True
     DATABASE_URI = 'sqlite:///:memory:'  # Use in-memory database for testing
@@ -141,6 +181,7 @@ class TestingConfig(BaseConfig):
 
 class ProductionConfig(BaseConfig):
     """Production configuration with security features enforced"""
+    __slots__ = ()
     DEBUG = False
     TESTING = False
     
@@ -176,6 +217,7 @@ class ProductionConfig(BaseConfig):
 
 class DockerConfig(ProductionConfig):
     """Configuration for Docker deployments"""
+    __slots__ = ()
     # Override specific settings for Docker environment
     SSL_REDIRECT = False  # Handled by reverse proxy in typical Docker setups
 
@@ -190,17 +232,40 @@ config = {
 }
 
 
-def get_config():
+@lru_cache(maxsize=None)
+def _config_instance(config_class):
+    """Instantiate and validate a configuration class, once per process."""
+    instance = config_class()
+    instance.validate()
+    return instance
+
+
+def get_config(env=None):
     """
     Load and return the appropriate configuration class based on the
     FLASK_ENV environment variable.
     
+    Each configuration class is instantiated and validated once and shared by
+    every later call, including aliases such as 'default' and unknown
+    environment names.
+    
+    Args:
+        env: Optional environment name (defaults to FLASK_ENV)
+    
     Returns:
         Config class appropriate for the current environment
+        
+    Raises:
+        ValueError: If the selected configuration fails validation
     """
-    env = os.environ.get('FLASK_ENV', 'default')
-    config_class = config.get(env, config['default'])
-    return config_class()
+    if env is None:
+        env = os.environ.get('FLASK_ENV', 'default')
+    return _config_instance(config.get(env, config['default']))
+
+
+def reset_config_cache():
+    """Drop the shared configuration instances so the next get_config() builds new ones."""
+    _config_instance.cache_clear()
 
 
 # For backwards compatibility with existing code
@@ -152,7 +152,7 @@ class ConversationManager:
         )
         
         self._conversations[conversation_id_str].messages.append(message)
-        logger.debug(f"Added message to conversation {conversation_id_str}")
+        logger.debug("Added message to conversation %s", conversation_id_str)
         
     def add_exchange(
         self,
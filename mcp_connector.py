@@ -75,8 +75,9 @@ class MCPConnector:
         await self.session.initialize()
 
         # List available tools in logs
-        response = await self.session.list_tools()
-        logger.debug(f"\nConnected to server with tools: {[tool.name for tool in response.tools]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            response = await self.session.list_tools()
+            logger.debug("Connected to server with tools: %s", [tool.name for tool in response.tools])
 
     
     async def get_tools(self):
@@ -107,10 +108,10 @@ class MCPConnector:
         self.fail_if_no_session()
         
         # Call the tool with the provided arguments
-        logger.debug(f"Calling tool '{tool_name}' with arguments: {tool_args}")
+        logger.debug("Calling tool '%s' with arguments: %s", tool_name, tool_args)
         result = await self.session.call_tool(tool_name, tool_args)
 
-        logger.debug(f"Tool '{tool_name}' response: {result}")     
+        logger.debug("Tool '%s' response: %s", tool_name, result)
 
         # check for error and raise an exception if needed
         if result.isError:
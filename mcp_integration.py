@@ -1,7 +1,7 @@
 import logging
 import asyncio
 import os
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, FrozenSet, List, Optional, Any, Callable
 from mcp_connector import MCPConnector
 from anthropic_config import AnthropicConfig
 
@@ -20,7 +20,7 @@ class MCPIntegration:
         self.config = config
         self.connector = MCPConnector()
         self.connected = False
-        self.available_tool_names = []
+        self.available_tool_names: FrozenSet[str] = frozenset()
 
     async def connect(self):
         """Connect to MCP server as configured."""
@@ -34,8 +34,8 @@ class MCPIntegration:
         self.connected = True
 
         tools = await self.connector.get_tools()
-        self.available_tool_names = [tool["name"] for tool in tools]
-        logger.info(f"Connected with tools: {self.available_tool_names}")
+        self.available_tool_names = frozenset(tool["name"] for tool in tools)
+        logger.info(f"Connected with tools: {sorted(self.available_tool_names)}")
 
     async def disconnect(self):
         """Disconnect from the MCP server."""
@@ -27,7 +27,8 @@ def get_models():
         models = anthropic_api.get_available_models()
         return jsonify({
             "success": True,
-            "models": models
+            # Model entries are read-only mappings; jsonify needs plain dicts
+            "models": [dict(model) for model in models]
         })
     except Exception as e:
         return jsonify({
@@ -201,9 +202,7 @@ def _validate_model_id(model_id: str) -> bool:
         True if model exists, False otherwise
     """
     try:
-        available_models = anthropic_api.get_available_models()
-        valid_model_ids = [model['id'] for model in available_models]
-        return model_id in valid_model_ids
+        return any(model['id'] == model_id for model in anthropic_api.get_available_models())
     except Exception:
         return False
 
@@ -987,4 +986,24 @@ def send_prompt_stream():
                 yield f"event: final\ndata: {json.dumps(item['data'])}\n\n"  # Enkele backslashes!
                 break
 
-    return Response(event_stream(), mimetype='text/event-stream')
\ No newline at end of file
+    return Response(event_stream(), mimetype='text/event-stream')
+
+
+# Error handlers
+@api_bp.errorhandler(404)
+def not_found(error):
+    """Handle 404 errors raised by API endpoints."""
+    return jsonify({
+        "success": False,
+        "error": "Endpoint niet gevonden"
+    }), 404
+
+
+@api_bp.errorhandler(500)
+def internal_error(error):
+    """Handle 500 errors raised by API endpoints."""
+    current_app.logger.error(f"Internal server error: {str(error)}")
+    return jsonify({
+        "success": False,
+        "error": "Interne serverfout"
+    }), 500
@@ -30,8 +30,8 @@ class TestAnthropicAPI(unittest.TestCase):
         """Test getting available models"""
         models = self.api.get_available_models()
         
-        # Check that models is a list
-        self.assertIsInstance(models, list)
+        # Check that models is a shared, read-only sequence
+        self.assertIsInstance(models, tuple)
         
         # Check that each model has the required fields
         for model in models:
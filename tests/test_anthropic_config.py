@@ -2,7 +2,7 @@
 import os
 import unittest
 from unittest.mock import patch, mock_open
-from anthropic_config import AnthropicConfig
+from anthropic_config import AnthropicConfig, _load_text_file
 
 
 class TestAnthropicConfig(unittest.TestCase):
@@ -22,6 +22,9 @@ class TestAnthropicConfig(unittest.TestCase):
             if var in os.environ:
                 self.env_vars[var] = os.environ[var]
                 del os.environ[var]
+        
+        # Prompt files are cached per process; start each test cold
+        _load_text_file.cache_clear()
     
     def tearDown(self):
         """Restore environment."""
@@ -30,6 +33,7 @@ class TestAnthropicConfig(unittest.TestCase):
                 os.environ[var] = value
             elif var in os.environ:
                 del os.environ[var]
+        _load_text_file.cache_clear()
     
     def test_api_key_from_parameter(self):
         """Test API key from parameter takes precedence."""
@@ -83,6 +87,18 @@ class TestAnthropicConfig(unittest.TestCase):
         config = AnthropicConfig()
         self.assertEqual(config.cache_ttl, '10m')
     
+    def test_settings_cached_per_instance(self):
+        """Test that settings are read once and refreshed by update_llm_settings."""
+        config = AnthropicConfig()
+        self.assertEqual(config.max_tokens, 4000)
+        
+        # Later environment changes don't affect an existing instance
+        os.environ['ANTHROPIC_MAX_TOKENS'] = '8000'
+        self.assertEqual(config.max_tokens, 4000)
+        
+        config.update_llm_settings(max_tokens=1000)
+        self.assertEqual(config.max_tokens, 1000)
+    
     @patch('builtins.open', new_callable=mock_open, read_data='Test system prompt')
     def test_system_prompt_lazy_loading(self, mock_file):
         """Test lazy loading of system prompt."""
@@ -101,6 +117,13 @@ class TestAnthropicConfig(unittest.TestCase):
         self.assertEqual(prompt2, 'Test system prompt')
         mock_file.assert_called_once()  # Still only called once
     
+    @patch('builtins.open', new_callable=mock_open, read_data='Test system prompt')
+    def test_system_prompt_shared_between_instances(self, mock_file):
+        """Test the system prompt file is read once for all instances."""
+        self.assertEqual(AnthropicConfig().system_prompt, 'Test system prompt')
+        self.assertEqual(AnthropicConfig().system_prompt, 'Test system prompt')
+        mock_file.assert_called_once()
+    
     def test_system_prompt_from_config_dict(self):
         """Test system prompt from config dictionary."""
         config = AnthropicConfig(config_dict={'ANTHROPIC_SYSTEM_PROMPT': 'Config prompt'})
@@ -142,9 +165,12 @@ class TestAnthropicConfig(unittest.TestCase):
         config = AnthropicConfig()
         models = config.available_models
         
-        self.assertIsInstance(models, list)
+        self.assertIsInstance(models, tuple)
         self.assertTrue(len(models) > 0)
         
+        # The same frozen table is shared between instances
+        self.assertIs(models, AnthropicConfig().available_models)
+        
         # Check model structure
         for model in models:
             self.assertIn('id', model)
@@ -183,6 +209,17 @@ class TestAnthropicConfig(unittest.TestCase):
         config = AnthropicConfig(api_key='test-key')
         self.assertTrue(config.validate())
     
+    def test_validate_result_cached_until_update(self):
+        """Test a successful validation is remembered until settings change."""
+        config = AnthropicConfig(api_key='test-key')
+        self.assertTrue(config.validate())
+        self.assertTrue(config.validate())
+        
+        # Changing settings forces the next call to validate again
+        config.update_llm_settings(max_tokens=-1)
+        with self.assertRaises(ValueError):
+            config.validate()
+    
     def test_validate_failure(self):
         """Test validation failure."""
         config = AnthropicConfig()
@@ -203,6 +240,10 @@ class TestAnthropicConfig(unittest.TestCase):
         os.environ['MCP_SERVERS'] = ' server1 , server2 , server3 '
         config = AnthropicConfig()
         self.assertEqual(config.mcp_servers, ['server1', 'server2', 'server3'])
+        
+        # Test already parsed value from config dict
+        config = AnthropicConfig(config_dict={'MCP_SERVERS': ('server1', 'server2')})
+        self.assertEqual(config.mcp_servers, ['server1', 'server2'])
     
     def test_mcp_server_paths(self):
         """Test MCP server path configuration."""
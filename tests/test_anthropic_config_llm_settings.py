@@ -56,6 +56,16 @@ class TestAnthropicConfigLLMSettings:
             with pytest.raises(ValueError, match="Temperature must be between 0.0 and 1.0"):
                 _ = config.temperature
     
+    def test_falsy_config_dict_values_override_env(self):
+        """Test that falsy config dict values are not replaced by the environment."""
+        with patch.dict(os.environ, {'ANTHROPIC_TEMPERATURE': '0.8', 'ANTHROPIC_MAX_TOKENS': '8000'}):
+            config = AnthropicConfig(config_dict={'ANTHROPIC_TEMPERATURE': 0.0})
+            assert config.temperature == 0.0
+            
+            config = AnthropicConfig(config_dict={'ANTHROPIC_MAX_TOKENS': 0})
+            with pytest.raises(ValueError, match="got 0"):
+                _ = config.max_tokens
+    
     def test_max_tokens_from_env(self):
         """Test max_tokens loading from environment variable."""
         with patch.dict(os.environ, {'ANTHROPIC_MAX_TOKENS': '8000'}):
@@ -199,6 +209,20 @@ class TestAnthropicConfigLLMSettings:
             settings = config.get_model_specific_settings('claude-3-sonnet-20240229')
             assert settings['max_tokens'] == 8192  # Sonnet max tokens
     
+    def test_model_specific_settings_cached_until_update(self):
+        """Test that model-specific settings are cached and reset on update."""
+        config = AnthropicConfig()
+        model_id = config.available_models[0]['id']
+        
+        settings = config.get_model_specific_settings(model_id)
+        assert config.get_model_specific_settings(model_id) is settings
+        
+        config.update_llm_settings(temperature=0.7, max_tokens=1234)
+        updated = config.get_model_specific_settings(model_id)
+        assert updated is not settings
+        assert updated['temperature'] == 0.7
+        assert updated['max_tokens'] == 1234
+    
     def test_config_validation_includes_llm_settings(self):
         """Test that config validation includes LLM settings validation."""
         # Valid config
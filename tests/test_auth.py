@@ -1,6 +1,11 @@
+import io
 import os
+import http.client
 import pytest
 import json
+import requests
+from collections import OrderedDict
+from types import SimpleNamespace
 from flask import Flask, session
 from unittest.mock import patch, MagicMock
 from app import create_app
@@ -46,6 +51,76 @@ def test_login_route(client):
         assert "accounts.google.com" in response.headers['Location']
 
 
+def test_google_provider_cfg_is_cached(app):
+    """Test the discovery document is fetched once and then reused"""
+    import auth
+    auth._discovery_cache.clear()
+    app.config['TESTING'] = False
+    
+    with app.app_context(), patch('auth._http.get') as mock_get:
+        mock_get.return_value.json.return_value = {"authorization_endpoint": "https://accounts.google.com/o/oauth2/auth"}
+        
+        first = auth.get_google_provider_cfg()
+        second = auth.get_google_provider_cfg()
+    
+    assert first == second
+    mock_get.assert_called_once_with(app.config['GOOGLE_DISCOVERY_URL'], timeout=auth.DISCOVERY_TIMEOUT)
+    auth._discovery_cache.clear()
+
+
+def test_google_provider_cfg_error_not_cached(app):
+    """Test a failed discovery request is not cached"""
+    import auth
+    auth._discovery_cache.clear()
+    app.config['TESTING'] = False
+    
+    with app.app_context(), patch('auth._http.get') as mock_get:
+        mock_get.return_value.raise_for_status.side_effect = requests.HTTPError("503 Server Error")
+        with pytest.raises(requests.HTTPError):
+            auth.get_google_provider_cfg()
+        assert app.config['GOOGLE_DISCOVERY_URL'] not in auth._discovery_cache
+        
+        # The next request tries again and caches the good response
+        mock_get.return_value.raise_for_status.side_effect = None
+        mock_get.return_value.json.return_value = {"authorization_endpoint": "https://accounts.google.com/o/oauth2/auth"}
+        assert auth.get_google_provider_cfg()["authorization_endpoint"]
+    
+    assert mock_get.call_count == 2
+    auth._discovery_cache.clear()
+
+
+class _CookieSettingAdapter(requests.adapters.HTTPAdapter):
+    """Answers every request with a JSON body and a Set-Cookie header."""
+    
+    def send(self, request, **kwargs):
+        body = {"access_token": "token", "token_type": "Bearer", "email_verified": False}
+        headers = http.client.parse_headers(io.BytesIO(b"Set-Cookie: NID=abc; Path=/\r\n\r\n"))
+        response = requests.Response()
+        response.status_code = 200
+        response.url = request.url
+        response.request = request
+        response._content = json.dumps(body).encode()
+        response.raw = SimpleNamespace(_original_response=SimpleNamespace(msg=headers))
+        return response
+
+
+def test_callback_does_not_keep_cookies(client):
+    """Test cookies from Google's responses are not shared between logins"""
+    import auth
+    adapters = OrderedDict([('https://', _CookieSettingAdapter())])
+    with patch.object(auth._http, 'adapters', adapters), \
+            patch.dict(os.environ, {'OAUTHLIB_INSECURE_TRANSPORT': '1'}):
+        response = client.get('/auth/login/callback?code=test-code')
+    
+    assert response.status_code == 302
+    assert len(auth._http.cookies) == 0
+
+
+def test_allowed_domains_frozen_on_init(app):
+    """Test ALLOWED_DOMAINS is converted to a frozenset for fast lookups"""
+    assert app.config['ALLOWED_DOMAINS'] == frozenset({'lynxx.com'})
+
+
 def test_callback_with_valid_user():
     """Test OAuth callback with valid user"""
     # This would be a more complex test with mock responses
@@ -4,7 +4,7 @@ from unittest import mock
 from flask import Flask
 from config import (
     BaseConfig, DevelopmentConfig, TestingConfig, 
-    ProductionConfig, DockerConfig, get_config
+    ProductionConfig, DockerConfig, get_config, reset_config_cache, _env_int
 )
 
 
@@ -25,6 +25,45 @@ class TestConfig(unittest.TestCase):
         self.assertIn('lynxx.com', config.ALLOWED_DOMAINS)
         self.assertTrue(config.ENABLE_DOMAIN_RESTRICTION)
         
+        # Upload extensies zijn een vaste, gedeelde set
+        self.assertIsInstance(config.ALLOWED_EXTENSIONS, frozenset)
+        self.assertIn('pdf', config.ALLOWED_EXTENSIONS)
+        
+        # Config objecten hebben geen __dict__ per instantie en zijn read-only
+        for config_class in (BaseConfig, DevelopmentConfig, TestingConfig, ProductionConfig, DockerConfig):
+            instance = config_class()
+            self.assertFalse(hasattr(instance, '__dict__'))
+            with self.assertRaises(AttributeError):
+                instance.DEBUG = True
+        self.assertIsInstance(config.ALLOWED_DOMAINS, frozenset)
+        
+    def test_anthropic_attributes(self):
+        """Test of ANTHROPIC_* instellingen gewone class attributen zijn"""
+        config = BaseConfig()
+        self.assertIn('ANTHROPIC_DEFAULT_MODEL', vars(BaseConfig))
+        self.assertEqual(config.ANTHROPIC_DEFAULT_MODEL, config.anthropic_config.default_model)
+        self.assertEqual(config.ANTHROPIC_MAX_TOKENS, config.anthropic_config.max_tokens)
+        self.assertEqual(list(config.MCP_SERVERS), config.anthropic_config.mcp_servers)
+        
+        with self.assertRaises(AttributeError):
+            config.ANTHROPIC_UNKNOWN
+        
+    def test_anthropic_config_dict_without_api_key(self):
+        """Test of de Anthropic configuratie zonder API key opgevraagd kan worden"""
+        with mock.patch.object(BaseConfig, '_anthropic_api_key', None):
+            config_dict = BaseConfig().get_anthropic_config_dict()
+        self.assertIsNone(config_dict['ANTHROPIC_API_KEY'])
+        self.assertEqual(config_dict['ANTHROPIC_MAX_TOKENS'], BaseConfig().anthropic_config.max_tokens)
+        
+    def test_env_int_invalid_value_falls_back(self):
+        """Test of een ongeldige integer instelling terugvalt op de default"""
+        with mock.patch.dict('config._ENV', {'ANTHROPIC_MAX_TOKENS': 'abc'}):
+            with self.assertLogs('config', level='ERROR'):
+                self.assertEqual(_env_int('ANTHROPIC_MAX_TOKENS', 4000), 4000)
+        
+        with mock.patch.dict('config._ENV', {'ANTHROPIC_MAX_TOKENS': '8000'}):
+            self.assertEqual(_env_int('ANTHROPIC_MAX_TOKENS', 4000), 8000)
+        
     def test_development_config(self):
         """Test of de development configuratie correct is"""
         config = DevelopmentConfig()
@@ -94,6 +133,25 @@ class TestConfig(unittest.TestCase):
             }, clear=True):
                 ProductionConfig()
     
+    def test_get_config_validates_once(self):
+        """Test of get_config de configuratie bij het aanmaken valideert"""
+        reset_config_cache()
+        with mock.patch.dict(os.environ, {'FLASK_ENV': 'production'}, clear=True):
+            with self.assertRaises(ValueError):
+                get_config()
+        
+        with mock.patch.dict(os.environ, {
+            'SECRET_KEY': 'test-secret-key',
+            'ANTHROPIC_API_KEY': 'test-api-key',
+            'GOOGLE_CLIENT_ID': 'test-client-id',
+            'GOOGLE_CLIENT_SECRET': 'test-client-secret',
+        }):
+            with mock.patch.object(ProductionConfig, 'validate', autospec=True) as mock_validate:
+                config = get_config('production')
+                self.assertIs(get_config('production'), config)
+                mock_validate.assert_called_once_with(config)
+        reset_config_cache()
+    
     def test_docker_config(self):
         """Test of de docker configuratie correct is"""
         with mock.patch.dict(os.environ, {
@@ -150,6 +208,22 @@ class TestConfig(unittest.TestCase):
         with mock.patch.dict(os.environ, {'FLASK_ENV': 'unknown'}, clear=True):
             config = get_config()
             self.assertIsInstance(config, DevelopmentConfig)
+    
+    def test_get_config_returns_shared_instance(self):
+        """Test of get_config per omgeving steeds hetzelfde object teruggeeft"""
+        reset_config_cache()
+        with mock.patch.dict(os.environ, {'FLASK_ENV': 'testing'}, clear=True):
+            config = get_config()
+            self.assertIs(get_config(), config)
+            self.assertIs(get_config('testing'), config)
+        
+        # Aliassen van dezelfde configuratie delen een object
+        self.assertIs(get_config('default'), get_config('development'))
+        self.assertIs(get_config('unknown'), get_config('development'))
+        
+        # Na een reset wordt een nieuw object aangemaakt
+        reset_config_cache()
+        self.assertIsNot(get_config('testing'), config)
 
 
 class TestConfigWithApp(unittest.TestCase):
@@ -167,6 +241,29 @@ class TestConfigWithApp(unittest.TestCase):
         self.assertTrue(self.app.config['DEBUG'])
         self.assertFalse(self.app.config['TESTING'])
         self.assertIn('lynxx.com', self.app.config['ALLOWED_DOMAINS'])
+    
+    def test_anthropic_secrets_and_prompts_not_in_app_config(self):
+        """Test of de API key en prompts niet in de Flask config terechtkomen"""
+        config = TestingConfig()
+        self.app.config.from_object(config)
+        
+        self.assertEqual(self.app.config['ANTHROPIC_DEFAULT_MODEL'], config.ANTHROPIC_DEFAULT_MODEL)
+        for key in ('ANTHROPIC_API_KEY', 'ANTHROPIC_SYSTEM_PROMPT', 'ANTHROPIC_WERKWIJZE'):
+            self.assertNotIn(key, self.app.config)
+        
+        # De Anthropic configuratie (en dus de prompt bestanden) is nog niet geladen
+        with self.assertRaises(AttributeError):
+            config._anthropic_config
+    
+    def test_log_formatter_shared(self):
+        """Test of de log formatter per formaat maar een keer gemaakt wordt"""
+        from app import _log_formatter
+        self.app.config.from_object(TestingConfig)
+        self.assertNotIn('LOG_FORMATTER', self.app.config)
+        
+        formatter = _log_formatter(self.app.config['LOG_FORMAT'])
+        self.assertEqual(formatter._fmt, self.app.config['LOG_FORMAT'])
+        self.assertIs(_log_formatter(DevelopmentConfig.LOG_FORMAT), formatter)
 
 
 if __name__ == '__main__':